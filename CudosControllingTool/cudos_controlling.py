@@ -7,45 +7,59 @@ Query Cudos internal systems using natural language from the command line.
 import json
 import sys
 import os
-import urllib.request
-import urllib.parse
+import time
 import argparse
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
-# Try to load .env file if python-dotenv is available
-try:
-    from dotenv import load_dotenv
+API_BASE_URL = "https://controlling-assistant-prod.nicedune-9fff3676.switzerlandnorth.azurecontainerapps.io"
+CONFIG_PATH = Path.home() / '.mbtools' / 'config.json'
+
+# Transient gateway errors from the Azure container app are retried with backoff
+RETRY_STATUS_CODES = (502, 503, 504)
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.2
+
+def _load_env() -> None:
+    """Load MBTOOLS_API_KEY from the repository .env file if python-dotenv is available."""
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        # python-dotenv not installed, skip .env loading
+        return
     # Load .env from repository root (parent of this script's directory)
     # Use resolve() to follow symlinks to the actual file location
     script_dir = Path(__file__).resolve().parent
     env_path = script_dir.parent / '.env'
-    if env_path.exists():
-        load_dotenv(env_path)
-except ImportError:
-    # python-dotenv not installed, skip .env loading
-    pass
-
-API_BASE_URL = "https://controlling-assistant-prod.nicedune-9fff3676.switzerlandnorth.azurecontainerapps.io"
-
+    # Skip parsing .env when the key is already provided by the environment
+    if not os.environ.get('MBTOOLS_API_KEY') and env_path.exists():
+        # Only pick up our key instead of exporting every .env entry
+        env_api_key = dotenv_values(env_path).get('MBTOOLS_API_KEY')
+        if env_api_key:
+            os.environ['MBTOOLS_API_KEY'] = env_api_key
+
+@lru_cache(maxsize=1)
 def get_api_key() -> Optional[str]:
-    """Get API key from environment or config file."""
+    """Get API key from environment or config file (resolved once per process)."""
     # Try environment variable first
     api_key = os.environ.get('MBTOOLS_API_KEY')
     if api_key:
         return api_key
 
     # Try config file
-    config_path = os.path.expanduser('~/.mbtools/config.json')
-    if os.path.exists(config_path):
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-            return config.get('api_key')
+    if CONFIG_PATH.exists():
+        config = json.loads(CONFIG_PATH.read_bytes())
+        return config.get('api_key')
 
     return None
 
 def query_api(endpoint: str, request_text: str) -> dict:
     """Make a query to the Controlling API."""
+    # Imported here so --help and argument errors don't pay for urllib
+    import urllib.request
+    import urllib.error
+
     api_key = get_api_key()
     if not api_key:
         return {
@@ -59,18 +73,23 @@ def query_api(endpoint: str, request_text: str) -> dict:
     }
     payload = json.dumps({'request': request_text}).encode('utf-8')
 
-    try:
-        req = urllib.request.Request(url, data=payload, headers=headers, method='POST')
-        with urllib.request.urlopen(req, timeout=30) as response:
-            return json.loads(response.read().decode('utf-8'))
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8') if e.fp else 'No error details'
-        return {
-            "error": f"HTTP {e.code}: {e.reason}",
-            "details": error_body
-        }
-    except Exception as e:
-        return {"error": f"API request failed: {str(e)}"}
+    req = urllib.request.Request(url, data=payload, headers=headers, method='POST')
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            with urllib.request.urlopen(req, timeout=30) as response:
+                return json.loads(response.read().decode('utf-8'))
+        except urllib.error.HTTPError as e:
+            if e.code in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+                e.close()  # release the error response's connection before retrying
+                time.sleep(RETRY_BACKOFF * 2 ** attempt)
+                continue
+            error_body = e.read().decode('utf-8') if e.fp else 'No error details'
+            return {
+                "error": f"HTTP {e.code}: {e.reason}",
+                "details": error_body
+            }
+        except Exception as e:
+            return {"error": f"API request failed: {str(e)}"}
 
 def query_rolx(query: str) -> dict:
     """Query RolX time tracking system."""
@@ -131,6 +150,7 @@ Examples:
     parser_bexio.add_argument('--json', action='store_true', help='Output raw JSON')
 
     args = parser.parse_args()
+    _load_env()
 
     # Execute the appropriate query
     if args.command == 'rolx':
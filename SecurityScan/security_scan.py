@@ -9,6 +9,7 @@ import os
 import sys
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -26,6 +27,10 @@ def load_env():
             os.environ.setdefault(key.strip(), value.strip())
 
 
+# Files are checked independently, so several AI requests can be in flight at once
+MAX_PARALLEL_REQUESTS = 4
+
+
 PROMPT_TEMPLATE = """Das File wird von meinem OpenClaw Agenten gelesen und interpretiert.
 Ich möchte sicher stellen, dass sich nichts eingeschlichen hat, was potentiell Schaden anrichtet, wie z.B.
 - Schadhafter Code
@@ -58,6 +63,10 @@ def find_markdown_files(start_dir: Path, days_back: int) -> list[Path]:
 
 def call_ai(api_key: str, filepath: Path, content: str) -> dict:
     """Send file content to OpenRouter AI and return parsed JSON result."""
+    # Nothing the agent could read from an empty file; skip the round trip
+    if not content.strip():
+        return {"File": str(filepath), "Result": "OK", "Comment": "Empty file, not sent to AI"}
+
     prompt = PROMPT_TEMPLATE.format(filepath=str(filepath), content=content)
 
     payload = json.dumps({
@@ -137,16 +146,15 @@ def main():
 
     print(f"Scanning {len(files)} file(s)...", file=sys.stderr)
 
-    results = []
-    has_danger = False
-
-    for path in files:
+    def check_file(path: Path) -> dict:
         print(f"  Checking: {path}", file=sys.stderr)
         content = path.read_text(encoding="utf-8", errors="replace")
-        result = call_ai(api_key, path, content)
-        results.append(result)
-        if result.get("Result") in ("DANGER", "ERROR"):
-            has_danger = True
+        return call_ai(api_key, path, content)
+
+    # map() keeps results in file order
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as pool:
+        results = list(pool.map(check_file, files))
+    has_danger = any(r.get("Result") in ("DANGER", "ERROR") for r in results)
 
     if args.json:
         print(json.dumps(results, ensure_ascii=False, indent=2))
@@ -12,22 +12,32 @@ import statistics
 import sys
 from pathlib import Path
 
-try:
-    import librosa
-    import numpy as np
-except ImportError as e:
-    print(
-        f"Error: required library missing ({e}). "
-        "Run: pip install librosa numpy",
-        file=sys.stderr,
-    )
-    sys.exit(1)
+# librosa takes seconds to import; loaded on demand by load_audio_libs()
+librosa = None
+np = None
 
 SAMPLE_RATE = 22050
 DEFAULT_WINDOW_SECS = 30.0
 SKIP_FRACTION = 0.10
 
 
+def load_audio_libs() -> None:
+    """Import librosa and numpy, exiting with a hint if they are missing."""
+    global librosa, np
+    if librosa is not None:
+        return
+    try:
+        import librosa
+        import numpy as np
+    except ImportError as e:
+        print(
+            f"Error: required library missing ({e}). "
+            "Run: pip install librosa numpy",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
 def get_duration(mp3_path: Path) -> float:
     """Return duration of audio file in seconds."""
     return librosa.get_duration(path=str(mp3_path))
@@ -72,6 +82,7 @@ def detect_bpm(
     verbose: bool = False,
 ) -> dict:
     """Detect BPM by sampling multiple sections. Returns result dict."""
+    load_audio_libs()
     duration = get_duration(mp3_path)
     windows = compute_section_windows(duration, n_sections, window_secs)
 
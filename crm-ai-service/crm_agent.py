@@ -13,12 +13,14 @@ import sys
 import time
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from crm_api import crm_login, crm_query, crm_retrieve
 
 MAX_RESULT_CHARS_DEFAULT = 50_000
+MAX_PARALLEL_TOOL_CALLS = 4
 
 
 # ---------------------------------------------------------------------------
@@ -65,11 +67,17 @@ def _log_section(title):
     _log(f"  {title}")
     _log('─' * 60)
 
-def _log_result_preview(label, result_json_str):
-    """Log the first 5 lines of a JSON result."""
+def _log_result_preview(label, result_json_str, more_records=0):
+    """Log the first 5 lines of a JSON result.
+
+    more_records: records left out of result_json_str (when only the head of a
+    list is rendered); reported instead of the remaining line count.
+    """
     lines = result_json_str.splitlines()
     preview = "\n".join(lines[:5])
-    if len(lines) > 5:
+    if more_records:
+        preview += f"\n  ... ({more_records} more record(s))"
+    elif len(lines) > 5:
         preview += f"\n  ... ({len(lines) - 5} more lines)"
     _log(f"{label}:\n{preview}")
 
@@ -162,38 +170,67 @@ def call_openrouter(messages, config, timeout, iteration):
 # Tool dispatch
 # ---------------------------------------------------------------------------
 
-def dispatch_tool(tool_call, base_url, session, verbose, max_result_chars):
-    """Execute a tool call and return the result as a JSON string."""
-    name = tool_call["function"]["name"]
-    try:
-        args = json.loads(tool_call["function"]["arguments"])
-    except (json.JSONDecodeError, KeyError) as e:
-        err = json.dumps({"error": f"Invalid tool arguments: {e}"})
-        _log(f"Tool call ERROR (bad args): {e}")
-        return err
+# Tool name -> handler(base_url, session, args); one entry per tool in TOOLS
+TOOL_HANDLERS = {
+    "crm_query": lambda base_url, session, args: crm_query(base_url, session, args["sql"]),
+    "crm_retrieve": lambda base_url, session, args: crm_retrieve(base_url, session, args["object_id"]),
+}
 
-    _log_section(f"AI tool call: {name}")
-    _log(f"Arguments: {json.dumps(args, ensure_ascii=False)}")
+# Worker threads for the CRM requests of one LLM turn (kept across turns so
+# their keep-alive connections are reused)
+_tool_pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_TOOL_CALLS, thread_name_prefix="crm-tool")
 
-    if verbose:
-        print(f"  [tool] {name}({json.dumps(args)})", file=sys.stderr)
+# CRM results for the current run, keyed by (tool name, canonical arguments).
+# The agent only reads, and the LLM often repeats an identical query or
+# retrieve across iterations — serve those without another round-trip.
+_result_cache = {}
+
+def _cache_key(name, args):
+    return name, json.dumps(args, sort_keys=True)
+
+def execute_tool(name, args, base_url, session):
+    """Run a CRM tool call, serving repeats from the run cache.
+
+    Returns (result, cached, elapsed). Does no logging, so that several calls
+    can run in worker threads at the same time.
+    """
+    cache_key = _cache_key(name, args)
+    if cache_key in _result_cache:
+        return _result_cache[cache_key], True, 0.0
 
     t0 = time.time()
     try:
-        if name == "crm_query":
-            result = crm_query(base_url, session, args["sql"])
-        elif name == "crm_retrieve":
-            result = crm_retrieve(base_url, session, args["object_id"])
+        handler = TOOL_HANDLERS.get(name)
+        if handler:
+            result = handler(base_url, session, args)
         else:
             result = {"error": f"Unknown tool: {name}"}
     except Exception as e:
         result = {"error": str(e)}
-    elapsed = time.time() - t0
+    else:
+        _result_cache[cache_key] = result
+    return result, False, time.time() - t0
+
 
-    result_str = json.dumps(result, indent=2, ensure_ascii=False)
+def format_tool_result(name, args, result, cached, elapsed, verbose, max_result_chars):
+    """Log an executed tool call and return its result as a JSON string."""
+    _log_section(f"AI tool call: {name}")
+    _log(f"Arguments: {json.dumps(args, ensure_ascii=False)}")
+
+    if verbose:
+        print(f"  [tool] {name}({json.dumps(args)})", file=sys.stderr)
+
+    # Only the first record is pretty-printed for the log preview — indenting
+    # the whole (possibly multi-MB) result just to keep five lines is wasted work
+    preview = result[:1] if isinstance(result, list) else result
+    preview_str = json.dumps(preview, indent=2, ensure_ascii=False)
     record_count = len(result) if isinstance(result, list) else 1
-    _log(f"CRM response in {elapsed:.2f}s — {record_count} record(s)")
-    _log_result_preview("Result preview (first 5 lines)", result_str)
+    if cached:
+        _log(f"CRM response from cache — {record_count} record(s)")
+    else:
+        _log(f"CRM response in {elapsed:.2f}s — {record_count} record(s)")
+    more_records = record_count - len(preview) if isinstance(result, list) else 0
+    _log_result_preview("Result preview (first 5 lines)", preview_str, more_records)
 
     # Check character limit
     full_str = json.dumps(result, ensure_ascii=False)
@@ -216,6 +253,48 @@ def dispatch_tool(tool_call, base_url, session, verbose, max_result_chars):
     return full_str
 
 
+def dispatch_tools(tool_calls, base_url, session, verbose, max_result_chars):
+    """Execute the tool calls of one LLM turn and return their results as JSON strings.
+
+    The calls are independent CRM reads, so they run concurrently; logging and
+    size checks happen afterwards in the original order to keep the log readable.
+    """
+    calls = []
+    # Identical calls within the turn share one execution (the run cache only
+    # sees a result once it has completed)
+    futures = {}
+    for tc in tool_calls:
+        name = tc["function"]["name"]
+        try:
+            args = json.loads(tc["function"]["arguments"])
+        except (json.JSONDecodeError, KeyError) as e:
+            error = str(e)
+        else:
+            # Valid JSON such as "null" or "[]" is still not a tool argument object
+            error = None if isinstance(args, dict) else f"expected a JSON object, got {type(args).__name__}"
+        if error is not None:
+            _log(f"Tool call ERROR (bad args): {error}")
+            calls.append((name, None, None, json.dumps({"error": f"Invalid tool arguments: {error}"})))
+            continue
+        key = _cache_key(name, args)
+        if key not in futures:
+            futures[key] = _tool_pool.submit(execute_tool, name, args, base_url, session)
+        calls.append((name, args, key, None))
+
+    results = []
+    seen = set()
+    for name, args, key, error_result in calls:
+        if error_result is not None:
+            results.append(error_result)  # argument error, nothing was executed
+            continue
+        result, cached, elapsed = futures[key].result()
+        if key in seen:
+            cached, elapsed = True, 0.0  # repeat of an earlier call in this turn
+        seen.add(key)
+        results.append(format_tool_result(name, args, result, cached, elapsed, verbose, max_result_chars))
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Agent loop
 # ---------------------------------------------------------------------------
@@ -327,8 +406,8 @@ def run_agent(task, config, timeout_seconds, verbose, max_result_chars=MAX_RESUL
             return content
 
         # Execute tool calls
-        for tc in tool_calls:
-            tool_result = dispatch_tool(tc, config["CRM_URL"], session, verbose, max_result_chars)
+        tool_results = dispatch_tools(tool_calls, config["CRM_URL"], session, verbose, max_result_chars)
+        for tc, tool_result in zip(tool_calls, tool_results):
             messages.append({
                 "role": "tool",
                 "tool_call_id": tc["id"],
@@ -4,10 +4,11 @@ crm_api- API for search and retrieval in the beerli/vTiger CRM
 """
 
 import hashlib
+import http.client
 import json
 import os
+import threading
 import urllib.parse
-import urllib.request
 from pathlib import Path
 
 
@@ -36,17 +37,72 @@ def load_config():
 # HTTP helpers
 # ---------------------------------------------------------------------------
 
+# One keep-alive connection per CRM host: an agent run issues many webservice
+# calls against the same server, so skip the TCP/TLS handshake after the first.
+# Connections are per thread, since http.client connections are not thread-safe.
+_local = threading.local()
+
+
+def _connection_key(url):
+    parts = urllib.parse.urlsplit(url)
+    return parts.scheme, parts.netloc
+
+
+def _connection(url):
+    if not hasattr(_local, "connections"):
+        _local.connections = {}
+    key = _connection_key(url)
+    conn = _local.connections.get(key)
+    if conn is None:
+        scheme, netloc = key
+        conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conn_cls(netloc, timeout=30)
+        _local.connections[key] = conn
+    return conn
+
+
+def _drop_connection(url):
+    conn = getattr(_local, "connections", {}).pop(_connection_key(url), None)
+    if conn is not None:
+        conn.close()
+
+
+def _http_request(url, method, query=None, body=None):
+    path = urllib.parse.urlsplit(url).path.rstrip("/") + "/webservice.php"
+    if query:
+        path += "?" + query
+    headers = {"Content-Type": "application/x-www-form-urlencoded"} if body is not None else {}
+    for attempt in range(2):
+        conn = _connection(url)
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            resp = conn.getresponse()
+            raw = resp.read()
+            break
+        except (http.client.RemoteDisconnected, ConnectionError):
+            # Server closed the idle keep-alive connection — reconnect once
+            _drop_connection(url)
+            if attempt:
+                raise
+        except Exception:
+            # Timeouts and protocol errors leave the connection mid-request;
+            # discard it so later calls on this thread start clean
+            _drop_connection(url)
+            raise
+    # Redirects are not followed (plain http.client, unlike urlopen)
+    if resp.status >= 300:
+        location = resp.getheader("Location")
+        suffix = f" (redirect to {location}; set CRM_URL to the final address)" if location else ""
+        raise RuntimeError(f"HTTP {resp.status}: {resp.reason}{suffix}")
+    return json.loads(raw.decode())
+
+
 def _http_get(url, params):
-    full_url = url + "/webservice.php?" + urllib.parse.urlencode(params)
-    with urllib.request.urlopen(full_url, timeout=30) as resp:
-        return json.loads(resp.read().decode())
+    return _http_request(url, "GET", query=urllib.parse.urlencode(params))
 
 
 def _http_post(url, params):
-    data = urllib.parse.urlencode(params).encode()
-    req = urllib.request.Request(url + "/webservice.php", data=data, method="POST")
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        return json.loads(resp.read().decode())
+    return _http_request(url, "POST", body=urllib.parse.urlencode(params).encode())
 
 
 # ---------------------------------------------------------------------------
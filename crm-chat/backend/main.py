@@ -6,6 +6,7 @@ Request:  {"query": "..."}
 Response: {"response": "..."}
 """
 
+import asyncio
 import json
 import subprocess
 from pathlib import Path
@@ -18,6 +19,10 @@ from pydantic import BaseModel
 
 CRM_AGENT_PATH = Path(__file__).parent.parent.parent / "crm-ai-service" / "crm_agent.py"
 
+# crm_agent.py rewrites a single crm_agent.log on every run, so only one agent
+# may run at a time; further chats wait for the running one to finish
+_agent_lock = asyncio.Semaphore(1)
+
 app = FastAPI(title="CRM Chat API")
 
 app.add_middleware(
@@ -57,7 +62,10 @@ def run_crm_agent(query: str) -> str:
 
 @app.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
-    response = run_crm_agent(request.query)
+    # Chats run one agent at a time (see _agent_lock); the up-to-60s run happens
+    # in a worker thread so the event loop, and with it /health, stays free
+    async with _agent_lock:
+        response = await asyncio.to_thread(run_crm_agent, request.query)
     return ChatResponse(response=response)
 
 
@@ -63,11 +63,14 @@ def open_dotx(path: Path) -> docx.Document:
 def extract_template_structure(doc: docx.Document) -> str:
     """Return a human-readable outline of the template structure."""
     lines = []
+    # doc.paragraphs / doc.tables build new lists on every access; fetch once
+    paragraphs = doc.paragraphs
+    tables = doc.tables
 
     # Collect all styles present in the template
-    available_styles = sorted({p.style.name for p in doc.paragraphs} |
+    available_styles = sorted({p.style.name for p in paragraphs} |
                                {p.style.name
-                                for t in doc.tables
+                                for t in tables
                                 for row in t.rows
                                 for cell in row.cells
                                 for p in cell.paragraphs})
@@ -77,20 +80,20 @@ def extract_template_structure(doc: docx.Document) -> str:
     # Walk body elements in order (paragraphs and tables)
     body = doc.element.body
     table_index = 0
+    # Map body elements to their paragraphs instead of scanning per element
+    paragraph_by_element = {p._element: p for p in paragraphs}
 
     for child in body:
         tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
 
         if tag == "p":
-            # Find matching paragraph
-            for p in doc.paragraphs:
-                if p._element is child:
-                    text = p.text.strip() or "(empty)"
-                    lines.append(f"PARAGRAPH [{p.style.name}]: {text!r}")
-                    break
+            p = paragraph_by_element.get(child)
+            if p is not None:
+                text = p.text.strip() or "(empty)"
+                lines.append(f"PARAGRAPH [{p.style.name}]: {text!r}")
 
         elif tag == "tbl":
-            t = doc.tables[table_index]
+            t = tables[table_index]
             lines.append(f"TABLE {table_index}: {len(t.rows)} rows × {len(t.columns)} cols")
             for ri, row in enumerate(t.rows):
                 seen_cells = set()
@@ -260,6 +263,10 @@ def call_ai_fill(api_key: str, schema: dict, input_text: str, model: str) -> dic
 
 # ── Document filling ──────────────────────────────────────────────────────────
 
+SECTION_HEADING_STYLE = "Überschrift 1.1"
+DEFAULT_ITEM_STYLE = "Body Text"
+
+
 def _set_cell_text(cell, text: str):
     """Set the text of a table cell, handling multiline values."""
     lines = text.split("\n")
@@ -276,9 +283,8 @@ def _set_cell_text(cell, text: str):
             cell.add_paragraph(line)
 
 
-def fill_document(template_path: Path, schema: dict, fill_data: dict, output_path: Path):
-    """Apply AI-generated fill data to the template and save as output_path."""
-    doc = open_dotx(template_path)
+def fill_document(doc: docx.Document, schema: dict, fill_data: dict, output_path: Path):
+    """Apply AI-generated fill data to the opened template and save as output_path."""
     body = doc.element.body
 
     # ── A: Fill title ────────────────────────────────────────────────────────
@@ -330,10 +336,9 @@ def fill_document(template_path: Path, schema: dict, fill_data: dict, output_pat
 
     # ── C: Replace content sections ──────────────────────────────────────────
     # Find the first section heading paragraph element
-    section_heading_style = "Überschrift 1.1"
     first_section_elem = None
     for p in doc.paragraphs:
-        if p.style.name == section_heading_style:
+        if p.style.name == SECTION_HEADING_STYLE:
             first_section_elem = p._element
             break
 
@@ -352,24 +357,32 @@ def fill_document(template_path: Path, schema: dict, fill_data: dict, output_pat
             body.remove(elem)
 
     # Add AI-generated sections
+    # doc.styles[...] searches the styles XML; resolve each style name once
+    known_styles = {}
+
+    def style_exists(name: str) -> bool:
+        if name not in known_styles:
+            try:
+                doc.styles[name]
+                known_styles[name] = True
+            except KeyError:
+                known_styles[name] = False
+        return known_styles[name]
+
     sections = fill_data.get("sections", [])
     for section in sections:
-        heading_style = section.get("heading_style", section_heading_style)
+        heading_style = section.get("heading_style", SECTION_HEADING_STYLE)
         # Validate style exists
-        try:
-            doc.styles[heading_style]
-        except KeyError:
-            heading_style = section_heading_style
+        if not style_exists(heading_style):
+            heading_style = SECTION_HEADING_STYLE
 
         doc.add_paragraph(section.get("heading", ""), style=heading_style)
 
         for item in section.get("items", []):
-            item_style = item.get("style", "Body Text")
-            try:
-                doc.styles[item_style]
-            except KeyError:
-                print(f"Warning: Style '{item_style}' not found, using 'Body Text'", file=sys.stderr)
-                item_style = "Body Text"
+            item_style = item.get("style", DEFAULT_ITEM_STYLE)
+            if not style_exists(item_style):
+                print(f"Warning: Style '{item_style}' not found, using '{DEFAULT_ITEM_STYLE}'", file=sys.stderr)
+                item_style = DEFAULT_ITEM_STYLE
             doc.add_paragraph(item.get("text", ""), style=item_style)
 
     doc.save(str(output_path))
@@ -433,7 +446,7 @@ def main():
     print(f"Output:    {output_path}", file=sys.stderr)
     print(f"Model:     {args.model}", file=sys.stderr)
 
-    # Open template and extract structure
+    # Open template once; the same document is extracted and then filled
     print("\nExtracting template structure...", file=sys.stderr)
     try:
         doc = open_dotx(template_path)
@@ -455,7 +468,7 @@ def main():
     # Fill and save document
     print("\nWriting output document...", file=sys.stderr)
     try:
-        fill_document(template_path, schema, fill_data, output_path)
+        fill_document(doc, schema, fill_data, output_path)
     except Exception as e:
         print(f"Error: Could not write document: {e}", file=sys.stderr)
         sys.exit(1)
@@ -20,6 +20,7 @@ import os
 import sys
 from pathlib import Path
 from datetime import datetime
+from itertools import islice
 
 # Konfiguration
 ARTICLES_DIR = Path("/home/reto/Development/NZZApp/backend/articles")
@@ -47,15 +48,16 @@ def parse_article_metadata(filepath: Path) -> dict:
     return {'title': title, 'url': url, 'filepath': filepath}
 
 
-def load_articles():
-    """Scannt das Artikelverzeichnis und gibt eine Liste von Artikeln zurück."""
-    if not ARTICLES_DIR.exists():
-        print(f"❌ Artikelverzeichnis nicht gefunden: {ARTICLES_DIR}")
-        sys.exit(1)
+def iter_articles(date_str=None):
+    """Liefert Artikel der Reihe nach (neuestes Datum zuerst), ohne alle vorab zu parsen."""
+    if date_str is not None:
+        # Nur das Verzeichnis des gewünschten Tages durchsuchen
+        date_dirs = [ARTICLES_DIR / date_str]
+    else:
+        date_dirs = sorted(ARTICLES_DIR.iterdir(), reverse=True)
 
-    articles = []
     # Datum-Verzeichnisse (Format YYYY-MM-DD)
-    for date_dir in sorted(ARTICLES_DIR.iterdir(), reverse=True):
+    for date_dir in date_dirs:
         if not date_dir.is_dir() or not date_dir.name[:4].isdigit():
             continue
         scraped_date = date_dir.name
@@ -65,14 +67,26 @@ def load_articles():
             category = category_dir.name
             for md_file in sorted(category_dir.glob('*.md')):
                 meta = parse_article_metadata(md_file)
-                articles.append({
+                yield {
                     'title': meta['title'],
                     'url': meta['url'],
                     'scraped_date': scraped_date,
                     'category': category.capitalize(),
                     'filepath': str(md_file),
-                })
-    return articles
+                }
+
+
+def load_articles(date_str=None, limit=None):
+    """Scannt das Artikelverzeichnis und gibt eine Liste von Artikeln zurück.
+
+    Mit date_str wird nur der entsprechende Tag gelesen, mit limit bricht
+    der Scan nach so vielen Artikeln ab.
+    """
+    if not ARTICLES_DIR.exists():
+        print(f"❌ Artikelverzeichnis nicht gefunden: {ARTICLES_DIR}")
+        sys.exit(1)
+
+    return list(islice(iter_articles(date_str), limit))
 
 
 def get_latest_articles(articles, count=10):
@@ -202,15 +216,9 @@ def main():
                 sys.exit(1)
             break
 
-    # Artikel laden
-    articles = load_articles()
-
-    if not articles:
-        print("📭 Keine Artikel im Index gefunden.")
-        return
-
     # Datum-Filter
     if date_str is not None:
+        articles = load_articles(date_str=date_str)
         if args:
             try:
                 number = int(args[0])
@@ -243,6 +251,13 @@ def main():
         show_articles_for_date(articles, date_str)
         return
 
+    # Artikel laden (nur die neuesten 10 werden angezeigt)
+    articles = load_articles(limit=10)
+
+    if not articles:
+        print("📭 Keine Artikel im Index gefunden.")
+        return
+
     # Liste anzeigen (Standard)
     if not args or '--list' in args or '-l' in args:
         show_article_list(articles)